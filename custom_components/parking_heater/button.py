@@ -7,7 +7,6 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ParkingHeaterCoordinator
@@ -24,47 +23,27 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
     buttons = [
-        ParkingHeaterTurnOnButton(coordinator),
-        ParkingHeaterTurnOffButton(coordinator),
+        ParkingHeaterPowerButton(coordinator, True),
+        ParkingHeaterPowerButton(coordinator, False),
     ]
     async_add_entities(buttons)
 
 
-class ParkingHeaterTurnOnButton(CoordinatorEntity[ParkingHeaterCoordinator], ButtonEntity):
-    """Button to turn on the heater."""
-
-    def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_name = f"{coordinator.entry.title} Turn On"
-        self._attr_unique_id = f"{coordinator.mac_address}_turn_on"
-        self._attr_icon = "mdi:power-on"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self.coordinator.device_info
-
-    async def async_press(self) -> None:
-        """Press the button."""
-        await self.coordinator.async_set_power(True)
+class ParkingHeaterPowerButton(ButtonEntity):
+    """Button to turn the heater on or off."""
 
+    _attr_should_poll = False
 
-class ParkingHeaterTurnOffButton(CoordinatorEntity[ParkingHeaterCoordinator], ButtonEntity):
-    """Button to turn off the heater."""
-
-    def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
+    def __init__(self, coordinator: ParkingHeaterCoordinator, power_on: bool) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_name = f"{coordinator.entry.title} Turn Off"
-        self._attr_unique_id = f"{coordinator.mac_address}_turn_off"
-        self._attr_icon = "mdi:power-off"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self.coordinator.device_info
+        self._coordinator = coordinator
+        self._power_on = power_on
+        state = "on" if power_on else "off"
+        self._attr_name = f"{coordinator.entry.title} Turn {state.capitalize()}"
+        self._attr_unique_id = f"{coordinator.mac_address}_turn_{state}"
+        self._attr_icon = f"mdi:power-{state}"
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Press the button."""
-        await self.coordinator.async_set_power(False)
+        await self._coordinator.async_set_power(self._power_on)
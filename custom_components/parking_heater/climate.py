@@ -12,13 +12,12 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_DEVICE_NAME,
-    CONF_MAC_ADDRESS,
     DOMAIN,
     FAN_SPEEDS,
     MAX_TEMP,
@@ -56,7 +55,7 @@ class ParkingHeaterClimate(CoordinatorEntity, ClimateEntity):
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.FAN_MODE
     )
-    _attr_fan_modes = list(FAN_SPEEDS.keys())
+    _attr_fan_modes = list(FAN_SPEEDS)
 
     def __init__(
         self,
@@ -65,72 +64,57 @@ class ParkingHeaterClimate(CoordinatorEntity, ClimateEntity):
     ) -> None:
         """Initialize the climate device."""
         super().__init__(coordinator)
-        self._attr_unique_id = entry.data[CONF_MAC_ADDRESS].replace(":", "").lower()
+        self._attr_unique_id = coordinator.mac_address_compact
         self._attr_name = entry.data.get(CONF_DEVICE_NAME, "Parking Heater")
-        self._mac_address = entry.data[CONF_MAC_ADDRESS]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
+        self._mac_address = coordinator.mac_address
+        self._attr_device_info = coordinator.device_info
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.data is not None
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        if self.coordinator.data and self.coordinator.data.get("is_on"):
-            return HVACMode.HEAT
-        return HVACMode.OFF
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        if not self.coordinator.data or not self.coordinator.data.get("is_on"):
-            return HVACAction.OFF
-        
-        current_temp = self.coordinator.data.get("current_temperature", MIN_TEMP)
-        target_temp = self.coordinator.data.get("target_temperature", MIN_TEMP)
-        
-        if current_temp < target_temp:
-            return HVACAction.HEATING
-        return HVACAction.IDLE
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        if self.coordinator.data:
-            return float(self.coordinator.data.get("current_temperature", MIN_TEMP))
-        return None
+        # CoordinatorEntity overrides available, so point it back at the cache
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Cache entity attributes from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_available = self.coordinator.last_update_success and data is not None
+        if not data:
+            self._attr_hvac_mode = HVACMode.OFF
+            self._attr_hvac_action = HVACAction.OFF
+            self._attr_current_temperature = None
+            self._attr_target_temperature = None
+            self._attr_fan_mode = "1"
+            self._attr_extra_state_attributes = {}
+            return
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        if self.coordinator.data:
-            return float(self.coordinator.data.get("target_temperature", MIN_TEMP))
-        return None
+        is_on = data.get("is_on")
+        current_temp = data.get("current_temperature", MIN_TEMP)
+        target_temp = data.get("target_temperature", MIN_TEMP)
 
-    @property
-    def fan_mode(self) -> str | None:
-        """Return the current fan mode."""
-        if self.coordinator.data:
-            fan_speed = self.coordinator.data.get("fan_speed", 1)
-            return str(fan_speed)
-        return "1"
+        self._attr_hvac_mode = HVACMode.HEAT if is_on else HVACMode.OFF
+        if not is_on:
+            self._attr_hvac_action = HVACAction.OFF
+        elif current_temp < target_temp:
+            self._attr_hvac_action = HVACAction.HEATING
+        else:
+            self._attr_hvac_action = HVACAction.IDLE
+        self._attr_current_temperature = float(current_temp)
+        self._attr_target_temperature = float(target_temp)
+        self._attr_fan_mode = str(data.get("fan_speed", 1))
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = {}
-        if self.coordinator.data:
-            attrs["mac_address"] = self._mac_address
-            error_code = self.coordinator.data.get("error_code", 0)
-            if error_code != 0:
-                attrs["error_code"] = error_code
-        return attrs
+        attrs: dict[str, Any] = {"mac_address": self._mac_address}
+        error_code = data.get("error_code", 0)
+        if error_code != 0:
+            attrs["error_code"] = error_code
+        self._attr_extra_state_attributes = attrs
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -165,5 +149,5 @@ class ParkingHeaterClimate(CoordinatorEntity, ClimateEntity):
             _LOGGER.warning("Invalid fan mode: %s", fan_mode)
             return
 
-        fan_speed = FAN_SPEEDS[fan_mode]
+        fan_speed = int(fan_mode)
         await self.coordinator.async_set_fan_speed(fan_speed)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -16,6 +17,7 @@ from .helpers.scan import async_ble_scan
 from homeassistant import config_entries
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
+    async_ble_device_from_address,
     async_discovered_service_info,
 )
 from homeassistant.const import CONF_ADDRESS
@@ -32,6 +34,13 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Advertised names that look like a parking heater
+_NAME_RE = re.compile(r"air|heater|parking", re.IGNORECASE)
+_SERVICE_UUID_LOWER = SERVICE_UUID.lower()
+_SERVICE_PREFIX = _SERVICE_UUID_LOWER[:8]
+_WRITE_CHAR_LOWER = WRITE_CHAR_UUID.lower()
+_NOTIFY_CHAR_LOWER = NOTIFY_CHAR_UUID.lower()
+
 
 class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Parking Heater."""
@@ -62,7 +71,9 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "connect_failed"
                 
                 # Re-scan to show the list again
-                discovered_devices = await async_ble_scan(timeout=5.0)
+                discovered_devices = await async_ble_scan(
+                    timeout=5.0, target_address=mac_address, hass=self.hass
+                )
                 device_options = {}
                 if discovered_devices:
                     for mac, info in discovered_devices.items():
@@ -102,8 +113,15 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        # Scan for Bluetooth devices using helper (covers adapters)
-        discovered_devices = await async_ble_scan(timeout=8.0)
+        # Scan for Bluetooth devices using helper (covers adapters), while
+        # collecting devices Home Assistant has already seen
+        scan_task = asyncio.create_task(async_ble_scan(timeout=8.0))
+        try:
+            cached_devices = await self._async_discover_devices()
+        except BaseException:
+            scan_task.cancel()
+            raise
+        discovered_devices = {**cached_devices, **await scan_task}
 
         # Convert to BluetoothServiceInfo-like dict used below
         # discovered_devices is address -> {name, rssi, uuids, address}
@@ -146,9 +164,11 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle bluetooth discovery."""
         _LOGGER.debug("Discovered device: %s", discovery_info)
-        
-        await self.async_set_unique_id(discovery_info.address.lower())
+
+        unique_id = discovery_info.address.lower()
+        await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
+        self._discovered_devices[unique_id] = discovery_info
 
         self.context["title_placeholders"] = {
             "name": discovery_info.name or discovery_info.address
@@ -192,13 +212,11 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         discovered = {}
         for service_info in async_discovered_service_info(self.hass):
             # Look for devices with the parking heater service UUID or matching name pattern
-            if SERVICE_UUID.lower() in [uuid.lower() for uuid in service_info.service_uuids]:
+            uuids_lower = {uuid.lower() for uuid in service_info.service_uuids}
+            if _SERVICE_UUID_LOWER in uuids_lower:
                 discovered[service_info.address] = service_info
                 self._discovered_devices[service_info.address] = service_info
-            elif service_info.name and any(
-                pattern in service_info.name.lower()
-                for pattern in ["air", "heater", "parking"]
-            ):
+            elif service_info.name and _NAME_RE.search(service_info.name):
                 discovered[service_info.address] = service_info
                 self._discovered_devices[service_info.address] = service_info
 
@@ -211,7 +229,10 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns (ok, reason)."""
         _LOGGER.debug("Attempting connection test to %s", address)
 
-        device = await BleakScanner.find_device_by_address(address, timeout=10.0)
+        # Reuse the BLEDevice Home Assistant already knows before scanning
+        device = async_ble_device_from_address(self.hass, address, connectable=True)
+        if not device:
+            device = await BleakScanner.find_device_by_address(address, timeout=10.0)
         if not device:
             _LOGGER.warning("Device with address %s not found for connection test", address)
             return False, "device_not_found"
@@ -222,25 +243,25 @@ class ParkingHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 BleakClientWithServiceCache, device, address
             )
 
-            # Ensure services are discovered
-            try:
-                services = await asyncio.wait_for(client.get_services(), timeout=10.0)
-            except Exception:
-                services = client.services
+            # Services are resolved by establish_connection
+            services = client.services
 
             found_service = False
             found_write = False
             found_notify = False
 
             for svc in services:
-                if svc.uuid.lower().startswith(SERVICE_UUID.lower()[:8]):
+                if svc.uuid.lower().startswith(_SERVICE_PREFIX):
                     found_service = True
                 for char in svc.characteristics:
                     cu = char.uuid.lower()
-                    if cu == WRITE_CHAR_UUID.lower():
+                    # Write and notify may share one characteristic
+                    if cu == _WRITE_CHAR_LOWER:
                         found_write = True
-                    if cu == NOTIFY_CHAR_UUID.lower():
+                    if cu == _NOTIFY_CHAR_LOWER:
                         found_notify = True
+                if found_service and found_write and found_notify:
+                    break
 
             if not found_service:
                 return False, "service_missing"
@@ -1,4 +1,5 @@
 """Constants for the Parking Heater integration."""
+from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final = "parking_heater"
@@ -17,6 +18,10 @@ SERVICE_UUID: Final = "0000ffe0-0000-1000-8000-00805f9b34fb"
 WRITE_CHAR_UUID: Final = "0000ffe1-0000-1000-8000-00805f9b34fb"
 NOTIFY_CHAR_UUID: Final = "0000ffe1-0000-1000-8000-00805f9b34fb"  # Same as write
 
+# Every frame is 8 bytes, so a single write fits the default ATT MTU.
+# Skip the write-response round-trip when the characteristic allows it.
+USE_WRITE_WITHOUT_RESPONSE: Final = True
+
 # Command bytes
 # Protocol: AA 55 [PW_1] [PW_2] [CMD] [DATA1] [DATA2] [CS]
 # Password is fixed "1234" -> 0x0C 0x22
@@ -35,11 +40,34 @@ CMD_TURN_OFF_BASE: Final = bytes([0xAA, 0x55, 0x0C, 0x22, 0x03, 0x00, 0x00])
 # Set Mode: AA 55 0C 22 02 [Mode] 00 [CS]
 # Mode 1 = Manual (Level Control), Mode 2 = Auto (Temp Control)
 CMD_SET_MODE_BASE: Final = bytes([0xAA, 0x55, 0x0C, 0x22, 0x02])
+MODE_MANUAL: Final = 1
+MODE_AUTO: Final = 2
 
 # Set Value: AA 55 0C 22 04 [Value] 00 [CS]
 # Used for both Level (1-10) and Temp (8-36) depending on Mode
 CMD_SET_VALUE_BASE: Final = bytes([0xAA, 0x55, 0x0C, 0x22, 0x04])
 
+
+def _append_checksum(frame: bytes) -> bytes:
+    """Return frame with its checksum byte (sum of bytes 2..end) appended."""
+    return frame + bytes([sum(frame[2:]) & 0xFF])
+
+
+# Full command frames (checksum included), computed once at import time
+CMD_TURN_ON: Final = _append_checksum(CMD_TURN_ON_BASE)
+CMD_TURN_OFF: Final = _append_checksum(CMD_TURN_OFF_BASE)
+CMD_SET_MODE_MANUAL: Final = _append_checksum(CMD_SET_MODE_BASE + bytes([MODE_MANUAL, 0x00]))
+CMD_SET_MODE_AUTO: Final = _append_checksum(CMD_SET_MODE_BASE + bytes([MODE_AUTO, 0x00]))
+CMD_SET_MODE_FRAMES: Final = {
+    MODE_MANUAL: CMD_SET_MODE_MANUAL,
+    MODE_AUTO: CMD_SET_MODE_AUTO,
+}
+
+# Indexed by value byte (0-255)
+CMD_SET_VALUE_FRAMES: Final = tuple(
+    _append_checksum(CMD_SET_VALUE_BASE + bytes([value, 0x00])) for value in range(256)
+)
+
 # Temperature range
 MIN_TEMP: Final = 8
 MAX_TEMP: Final = 36
@@ -51,13 +79,10 @@ MAX_LEVEL: Final = 10
 LEVEL_STEP: Final = 1
 
 # Fan speeds (Not directly controllable in this protocol, usually auto)
-FAN_SPEEDS: Final = {
-    "1": 1,
-    "2": 2,
-    "3": 3,
-    "4": 4,
-    "5": 5,
-}
+FAN_SPEEDS: Final[tuple[str, ...]] = ("1", "2", "3", "4", "5")
 
 # Update interval
-UPDATE_INTERVAL: Final = 5  # Fast polling for active status
+UPDATE_INTERVAL_ACTIVE: Final = timedelta(seconds=5)  # Fast polling while running
+UPDATE_INTERVAL_IDLE: Final = timedelta(seconds=60)  # Slow polling while off
+UPDATE_INTERVAL_ERROR: Final = timedelta(seconds=60)  # Back off after a failed poll
+UPDATE_INTERVAL_ERROR_JITTER: Final = 10  # seconds, spreads out reconnect attempts
@@ -2,36 +2,71 @@
 from __future__ import annotations
 
 import asyncio
-import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import timedelta
+import logging
+import random
 from typing import Any
 
+from bleak.exc import BleakError
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_MAC_ADDRESS, DOMAIN, UPDATE_INTERVAL
+from .const import (
+    CONF_MAC_ADDRESS,
+    DOMAIN,
+    UPDATE_INTERVAL_ACTIVE,
+    UPDATE_INTERVAL_ERROR,
+    UPDATE_INTERVAL_ERROR_JITTER,
+    UPDATE_INTERVAL_IDLE,
+)
 from .heater_client import ParkingHeaterClient
 
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_DISCONNECTED_MANUAL = "Disconnected (Manual)"
+
+# Seconds to wait after a command before polling the heater again
+REFRESH_DELAY = 1.0
+# Seconds to hold a command so rapid changes collapse into one write
+COMMAND_DEBOUNCE = 0.3
+
 
 class ParkingHeaterCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Parking Heater data."""
 
+    # Command kind -> (client setter, status field it changes). Fan speed is
+    # not supported by the protocol yet, so it never reports a written value
+    _COMMANDS: dict[str, tuple[str, str | None]] = {
+        "power": ("set_power", "is_on"),
+        "temperature": ("set_temperature", "target_temperature"),
+        "level": ("set_level", "target_level"),
+        "fan_speed": ("set_fan_speed", None),
+    }
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=UPDATE_INTERVAL_ACTIVE,
+            # Status dicts compare by value, so identical polls skip listener updates
+            always_update=False,
         )
         self.entry = entry
         self.mac_address = entry.data[CONF_MAC_ADDRESS]
-        self.client = ParkingHeaterClient(self.mac_address, hass)
+        self.mac_address_compact = self.mac_address.replace(":", "").lower()
         self.client = ParkingHeaterClient(self.mac_address, hass)
         self._lock = asyncio.Lock()
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._debounced_values: dict[str, Any] = {}
+        self._pending_cmds: deque[tuple[str, Any]] = deque()
+        self._debounce_handles: dict[str, asyncio.TimerHandle] = {}
         self._desired_connection_status = True # Default to auto-connect
 
     @property
@@ -50,13 +85,9 @@ class ParkingHeaterCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("async_connect called - setting desired_connection_status=True")
         self._desired_connection_status = True
         
-        # Instant UI Feedback: Set status to Connecting
-        if self.data:
-            self.data["connection_status"] = "Connecting..."
-            self.async_set_updated_data(self.data)
-
         try:
-            await self.client.connect()
+            async with self._lock, self._ensure_connected():
+                pass
             _LOGGER.info("Successfully connected to parking heater at %s", self.mac_address)
             await self.async_request_refresh() # Update UI with real data
         except Exception as err:
@@ -68,19 +99,64 @@ class ParkingHeaterCoordinator(DataUpdateCoordinator):
         """Disconnect from the device."""
         _LOGGER.debug("async_disconnect called - setting desired_connection_status=False")
         self._desired_connection_status = False
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        for handle in self._debounce_handles.values():
+            handle.cancel()
+        self._debounce_handles.clear()
+        self._debounced_values.clear()
+        self._pending_cmds.clear()
         
         # Instant UI Feedback: Set status to Disconnected
         # We use a default status but keep the "Disconnected (Manual)" message
-        data = self.client._get_default_status()
-        data["connection_status"] = "Disconnected (Manual)"
-        self.data = data
-        self.async_set_updated_data(self.data)
+        self.async_set_updated_data(self._manual_disconnect_status())
 
         await self.client.disconnect()
         _LOGGER.info("Disconnected from parking heater at %s", self.mac_address)
         # No need to request refresh as we already updated the data, but it doesn't hurt to ensure consistency
         # await self.async_request_refresh()
 
+    def _manual_disconnect_status(self) -> dict[str, Any]:
+        """Return the status shown while the user keeps the heater disconnected.
+
+        The current data is reused when it already is that status, so idle
+        polls neither allocate nor notify listeners.
+        """
+        if self.data and self.data.get("connection_status") == STATUS_DISCONNECTED_MANUAL:
+            return self.data
+        data = self.client._get_default_status()
+        data["connection_status"] = STATUS_DISCONNECTED_MANUAL
+        return data
+
+    @asynccontextmanager
+    async def _ensure_connected(self) -> AsyncIterator[None]:
+        """Connect on demand and drop the link if the block hits a transport error.
+
+        Callers must hold self._lock.
+        """
+        try:
+            if not self.client.is_connected:
+                # Instant UI Feedback: Set status to Connecting
+                if self.data:
+                    self.data["connection_status"] = "Connecting..."
+                    self.async_set_updated_data(self.data)
+
+                await self.client.connect()
+            yield
+        except (BleakError, TimeoutError):
+            # Only tear down the link on transport failures; keep the
+            # connection and notify subscription for the next poll otherwise
+            await self._safe_disconnect()
+            raise
+
+    async def _safe_disconnect(self) -> None:
+        """Disconnect, ignoring errors while cleaning up."""
+        try:
+            await self.client.disconnect()
+        except (BleakError, TimeoutError, OSError) as err:
+            _LOGGER.debug("Cleanup disconnect failed: %s", err)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
         # Initialize default data structure if not present
@@ -96,39 +172,40 @@ class ParkingHeaterCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Desired status is False but client is connected. Disconnecting...")
                 await self.client.disconnect()
             
-            data = self.client._get_default_status()
-            data["connection_status"] = "Disconnected (Manual)"
-            return data
+            return self._manual_disconnect_status()
 
         async with self._lock:
             # Check again if we still want to be connected
             if not self._desired_connection_status:
                 _LOGGER.debug("Skipping update because disconnect was requested")
-                return self.client._get_default_status()
+                return self._manual_disconnect_status()
 
             try:
-                if not self.client.is_connected:
-                    # Update status to Connecting
-                    if self.data:
-                        self.data["connection_status"] = "Connecting..."
-                        self.async_set_updated_data(self.data) # Force update to show "Connecting"
-                    
-                    await self.client.connect()
-                
-                # Fetch data
-                data = await self.client.get_status()
+                async with self._ensure_connected():
+                    # Write queued commands in the same session as the poll
+                    written = await self._async_send_pending_commands()
+
+                    # Fetch data
+                    data = await self.client.get_status()
+
+                # The heater may not report new settings yet; keep what we sent
+                # until the follow-up refresh confirms it
+                data.update(written)
                 data["connection_status"] = "Connected"
+                # Poll fast only while the heater is running
+                self.update_interval = (
+                    UPDATE_INTERVAL_ACTIVE if data["is_on"] else UPDATE_INTERVAL_IDLE
+                )
                 _LOGGER.debug("Received data from parking heater: %s", data)
                 return data
 
             except Exception as err:
                 _LOGGER.error("Error communicating with parking heater: %s", err)
-                # Try to disconnect to clean up state
-                try:
-                    await self.client.disconnect()
-                except:
-                    pass
-                
+                # Back off, with jitter, instead of retrying in a tight loop
+                self.update_interval = UPDATE_INTERVAL_ERROR + timedelta(
+                    seconds=random.uniform(0, UPDATE_INTERVAL_ERROR_JITTER)
+                )
+
                 # Return previous data with error status if available, otherwise default
                 if self.data and self.data.get("connection_status") != "Initializing":
                     data = self.data.copy()
@@ -139,60 +216,75 @@ class ParkingHeaterCoordinator(DataUpdateCoordinator):
                 data["connection_status"] = f"Error: {str(err)[:20]}..."
                 return data
 
-    async def async_set_power(self, power_on: bool) -> None:
-        """Turn the heater on or off."""
-        async with self._lock:
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule a status refresh shortly after a command."""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        self._refresh_handle = self.hass.loop.call_later(
+            REFRESH_DELAY, self._refresh_callback
+        )
+
+    @callback
+    def _refresh_callback(self) -> None:
+        """Run the delayed refresh outside of the command lock."""
+        self._refresh_handle = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_send_pending_commands(self) -> dict[str, Any]:
+        """Write queued commands and return the status fields they set."""
+        written: dict[str, Any] = {}
+        while self._pending_cmds:
+            kind, value = self._pending_cmds.popleft()
+            setter, key = self._COMMANDS[kind]
             try:
-                if not self.client.is_connected:
-                    await self.client.connect()
-                
-                await self.client.set_power(power_on)
-                # Request immediate update
-                await asyncio.sleep(1)
-                await self.async_request_refresh()
-            except Exception as err:
-                _LOGGER.error("Error setting power state: %s", err)
-                # Ensure we disconnect to reset state for next attempt
-                try:
-                    await self.client.disconnect()
-                except:
-                    pass
+                await getattr(self.client, setter)(value)
+            except (BleakError, TimeoutError, OSError) as err:
+                # Keep the command for the next poll unless a newer one replaced it
+                if not any(queued == kind for queued, _ in self._pending_cmds):
+                    self._pending_cmds.appendleft((kind, value))
+                _LOGGER.warning("Failed to send %s=%s, will retry: %s", kind, value, err)
                 raise
+            except Exception as err:
+                _LOGGER.error("Dropping %s=%s: %s", kind, value, err)
+                continue
+            if key is not None:
+                written[key] = value
+        return written
+
+    async def async_set_power(self, power_on: bool) -> None:
+        """Turn the heater on or off."""
+        self._debounce_command("power", power_on)
 
     async def async_set_temperature(self, temperature: int) -> None:
         """Set the target temperature."""
-        async with self._lock:
-            try:
-                if not self.client.is_connected:
-                    await self.client.connect()
-                
-                await self.client.set_temperature(temperature)
-                # Request immediate update
-                await asyncio.sleep(1)
-                await self.async_request_refresh()
-            except Exception as err:
-                _LOGGER.error("Error setting temperature: %s", err)
-                try:
-                    await self.client.disconnect()
-                except:
-                    pass
-                raise
+        self._debounce_command("temperature", temperature)
+
+    async def async_set_level(self, level: int) -> None:
+        """Set the power level."""
+        self._debounce_command("level", level)
 
     async def async_set_fan_speed(self, fan_speed: int) -> None:
         """Set the fan speed."""
-        async with self._lock:
-            try:
-                if not self.client.is_connected:
-                    await self.client.connect()
-                
-                await self.client.set_fan_speed(fan_speed)
-                # Request immediate update
-                await asyncio.sleep(1)
-                await self.async_request_refresh()
-            except Exception as err:
-                _LOGGER.error("Error setting fan speed: %s", err)
-                try:
-                    await self.client.disconnect()
-                except:
-                    pass
-                raise
+        self._debounce_command("fan_speed", fan_speed)
+
+    @callback
+    def _debounce_command(self, kind: str, value: Any) -> None:
+        """Hold a command briefly so only the last of a burst is written."""
+        self._debounced_values[kind] = value
+        if (handle := self._debounce_handles.pop(kind, None)) is not None:
+            handle.cancel()
+        self._debounce_handles[kind] = self.hass.loop.call_later(
+            COMMAND_DEBOUNCE,
+            lambda: self.hass.async_create_task(self._async_flush_command(kind)),
+        )
+
+    async def _async_flush_command(self, kind: str) -> None:
+        """Queue the latest value for a command and run a poll to send it."""
+        self._debounce_handles.pop(kind, None)
+        self._pending_cmds.append((kind, self._debounced_values.pop(kind)))
+        # Bypass the request debouncer so the command is not held back
+        await self.async_refresh()
+
+        # Confirm the new state once the heater has applied it
+        self._schedule_refresh()
@@ -2,26 +2,70 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import logging
 import struct
+import time
 from typing import Any, Callable
 
 from bleak import BleakClient, BleakGATTCharacteristic, BleakScanner
 from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection, BleakClientWithServiceCache
 
+from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
 
 from .const import (
     CMD_GET_STATUS,
+    CMD_SET_MODE_FRAMES,
+    CMD_SET_VALUE_FRAMES,
+    CMD_TURN_OFF,
+    CMD_TURN_ON,
     MAX_TEMP,
     MIN_TEMP,
+    MODE_AUTO,
+    MODE_MANUAL,
     NOTIFY_CHAR_UUID,
+    USE_WRITE_WITHOUT_RESPONSE,
     WRITE_CHAR_UUID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status packet bytes 0-14: AA 55 [CMD] [RunState] [Error] xx xx xx
+# [Mode] [B9] [B10] xx xx [CaseTemp hi] [CaseTemp lo]
+_STATUS_HEADER = struct.Struct(">3xBB3xBBB2xh")
+_INT16_BE = struct.Struct(">h")
+_STATUS_CMD = 0x01
+# Run states that count as the heater being on
+_ON_STATES = frozenset({1, 2, 3, 4})
+
+# Notifications are XORed with a repeating "password" key
+_KEY = b"password"
+_KEYSTREAM = _KEY * 64  # Covers the largest possible ATT payload
+
+_DEFAULT_STATUS: dict[str, Any] = {
+    "is_on": False,
+    "target_temperature": MIN_TEMP,
+    "target_level": 1,
+    "current_temperature": MIN_TEMP,
+    "chamber_temperature": MIN_TEMP,
+    "fan_speed": 1,
+    "error_code": 0,
+    "connection_status": "Unknown",
+}
+
+# Seconds a status read is reused by other callers
+STATUS_CACHE_TTL = 0.5
+
+# Seconds the heater needs to apply an (unacknowledged) mode switch
+MODE_SETTLE_DELAY = 0.5
+
+# Upper bounds (seconds) so a stalled BLE stack cannot block a poll forever
+CONNECT_TIMEOUT = 30.0
+NOTIFY_TIMEOUT = 5.0
+WRITE_TIMEOUT = 3.0
+
 
 class ParkingHeaterClient:
     """Client for communicating with parking heater via Bluetooth."""
@@ -32,16 +76,21 @@ class ParkingHeaterClient:
         self.hass = hass
         _LOGGER.info("Initializing Parking Heater Client v1.0.4")
         self._client: BleakClient | None = None
-        self._notification_data: bytearray = bytearray()
-        self._notification_event = asyncio.Event()
+        self._response_future: asyncio.Future[bytes] | None = None
+        self._expected_cmd: int | None = None
+        self._rx_frames: deque[bytes] = deque()
+        self._rx_scheduled = False
+        self._status_cache: tuple[float, dict[str, Any]] | None = None
+        self._status_inflight: asyncio.Future[dict[str, Any]] | None = None
         self._is_connected = False
-        
-        # Command Queue
-        self._command_queue: asyncio.Queue = asyncio.Queue()
-        self._command_worker_task: asyncio.Task | None = None
+        self._notify_started = False
+        self._write_response = not USE_WRITE_WITHOUT_RESPONSE
+        self._write_char: BleakGATTCharacteristic | str = WRITE_CHAR_UUID
+        self._notify_char: BleakGATTCharacteristic | str = NOTIFY_CHAR_UUID
         
         # Local State Tracking (Fallback)
         self._last_set_level: int | None = None
+        self._last_mode: int | None = None
 
     @property
     def is_connected(self) -> bool:
@@ -56,27 +105,50 @@ class ParkingHeaterClient:
         try:
             _LOGGER.debug("Connecting to %s", self.mac_address)
 
-            device = await BleakScanner.find_device_by_address(
-                self.mac_address, timeout=20.0
+            # Prefer the BLEDevice Home Assistant already tracks over a fresh scan
+            device = bluetooth.async_ble_device_from_address(
+                self.hass, self.mac_address, connectable=True
             )
+            if not device:
+                device = await BleakScanner.find_device_by_address(
+                    self.mac_address, timeout=20.0
+                )
             if not device:
                 raise BleakError(f"Device with address {self.mac_address} not found")
 
-            self._client = await establish_connection(
-                BleakClientWithServiceCache,
-                device,
-                self.mac_address,
-                disconnected_callback=self._on_disconnect,
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                self._client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    device,
+                    self.mac_address,
+                    disconnected_callback=self._on_disconnect,
+                    max_attempts=3,
+                    use_services_cache=True,
+                )
+
+            # Resolve characteristics once so writes skip the UUID lookup
+            services = self._client.services
+            write_char = services.get_characteristic(WRITE_CHAR_UUID)
+            notify_char = services.get_characteristic(NOTIFY_CHAR_UUID)
+            self._write_char = write_char or WRITE_CHAR_UUID
+            self._notify_char = notify_char or NOTIFY_CHAR_UUID
+
+            # Fall back to acknowledged writes if the characteristic requires them
+            self._write_response = not (
+                USE_WRITE_WITHOUT_RESPONSE
+                and write_char is not None
+                and "write-without-response" in write_char.properties
             )
 
-            # Subscribe to notifications
-            await self._client.start_notify(NOTIFY_CHAR_UUID, self._notification_handler)
+            # Subscribe once; the subscription lives as long as the connection
+            if not self._notify_started:
+                async with asyncio.timeout(NOTIFY_TIMEOUT):
+                    await self._client.start_notify(
+                        self._notify_char, self._notification_handler
+                    )
+                self._notify_started = True
             self._is_connected = True
             
-            # Start Command Worker
-            if self._command_worker_task is None or self._command_worker_task.done():
-                self._command_worker_task = asyncio.create_task(self._command_worker())
-            
             _LOGGER.info("Connected to parking heater at %s", self.mac_address)
         except Exception as err:
             _LOGGER.error("Failed to connect to %s: %s", self.mac_address, err)
@@ -85,212 +157,223 @@ class ParkingHeaterClient:
 
     async def disconnect(self) -> None:
         """Disconnect from the device."""
-        # Stop Command Worker
-        if self._command_worker_task:
-            self._command_worker_task.cancel()
-            try:
-                await self._command_worker_task
-            except asyncio.CancelledError:
-                pass
-            self._command_worker_task = None
-
         if self._client is not None:
             try:
                 if self._client.is_connected:
-                    try:
-                        # Try to stop notifications, but don't block forever
-                        await asyncio.wait_for(self._client.stop_notify(NOTIFY_CHAR_UUID), timeout=2.0)
-                    except Exception as e:
-                        _LOGGER.warning("Failed to stop notifications during disconnect: %s", e)
-                    
+                    # BlueZ drops the notify subscription with the connection
                     await self._client.disconnect()
             except Exception as err:
                 _LOGGER.error("Error disconnecting: %s", err)
             finally:
                 self._client = None
                 self._is_connected = False
+                self._notify_started = False
+                self._last_mode = None
+                self._invalidate_status()
 
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle disconnection."""
         _LOGGER.warning("Disconnected from parking heater at %s", self.mac_address)
         self._is_connected = False
+        self._notify_started = False
+        # The phone app may change the heater while the link is down
+        self._last_mode = None
+        self._invalidate_status()
 
-    async def _command_worker(self) -> None:
-        """Process commands from the queue with a delay."""
-        _LOGGER.debug("Command worker started")
-        while True:
-            try:
-                # Get command from queue
-                cmd_item = await self._command_queue.get()
-                command, wait_for_response, timeout, future = cmd_item
-                
-                try:
-                    if not self.is_connected:
-                         raise BleakError("Not connected")
-
-                    # Execute command
-                    result = await self._send_command_internal(command, wait_for_response, timeout)
-                    if not future.done():
-                        future.set_result(result)
-                except Exception as e:
-                    if not future.done():
-                        future.set_exception(e)
-                finally:
-                    self._command_queue.task_done()
-                
-                # Buffer delay to prevent overwhelming the device
-                await asyncio.sleep(0.8) 
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                _LOGGER.error("Error in command worker: %s", e)
-                await asyncio.sleep(1.0)
+    def _decrypt_data(self, data: bytes | bytearray) -> bytes:
+        """Decrypts data by XORing with 'password'."""
+        n = len(data)
+        keystream = _KEYSTREAM if n <= len(_KEYSTREAM) else _KEY * (n // len(_KEY) + 1)
+        # XOR the whole packet as two big integers instead of byte by byte
+        return (
+            int.from_bytes(data, "big") ^ int.from_bytes(keystream[:n], "big")
+        ).to_bytes(n, "big")
 
     def _notification_handler(
         self, sender: BleakGATTCharacteristic, data: bytearray
     ) -> None:
-        """Handle notification data."""
-        _LOGGER.debug("Received notification: %s", data.hex())
-        self._notification_data = data
-        self._notification_event.set()
+        """Handle notification data.
+
+        Some backends call this off the event loop, so frames are queued and
+        drained on the loop with at most one pending wake-up per burst.
+        """
+        # Only encrypted packets (starting with DA) carry frames
+        if not data or data[0] != 0xDA:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received notification: %s", data.hex())
+            return
 
-    async def _send_command(self, command: bytes, wait_for_response: bool = True, timeout: float = 5.0) -> bytearray:
-        """Queue a command and wait for result."""
+        self._rx_frames.append(bytes(data))
+        if not self._rx_scheduled:
+            self._rx_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._drain_rx)
+
+    def _drain_rx(self) -> None:
+        """Decrypt every queued notification and hand frames to the waiter."""
+        self._rx_scheduled = False
+        frames = self._rx_frames
+        while frames:
+            data = frames.popleft()
+            decrypted = self._decrypt_data(data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Received notification: %s (decrypted %s)",
+                    data.hex(),
+                    decrypted.hex(),
+                )
+
+            # Drop anything that is not a complete AA 55 [CMD] frame
+            if len(decrypted) > 2 and decrypted.startswith(b"\xaa\x55"):
+                self._resolve_response(decrypted)
+
+    def _resolve_response(self, frame: bytes) -> None:
+        """Hand a frame to the pending command if it is the reply it expects."""
+        future = self._response_future
+        if future is None or future.done():
+            return
+        if self._expected_cmd is not None and frame[2] != self._expected_cmd:
+            _LOGGER.debug("Skipping unrelated packet (cmd=%02x)", frame[2])
+            return
+        future.set_result(frame)
+
+    async def _send_command(
+        self,
+        command: bytes,
+        wait_for_response: bool = True,
+        timeout: float = 5.0,
+        expected_cmd: int | None = None,
+    ) -> bytearray:
+        """Send a command and wait for response.
+
+        If expected_cmd is given, frames for other commands are skipped.
+        """
         if not self.is_connected:
             raise BleakError("Not connected to device")
-            
-        future = asyncio.get_running_loop().create_future()
-        await self._command_queue.put((command, wait_for_response, timeout, future))
-        
-        # Wait for the worker to process it
-        return await future
 
-    async def _send_command_internal(self, command: bytes, wait_for_response: bool = True, timeout: float = 5.0) -> bytearray:
-        """Internal method to send command (executed by worker)."""
-        if not self.is_connected:
-            raise BleakError("Not connected to device")
+        if command is not CMD_GET_STATUS:
+            # Anything but a status request may change what the heater reports
+            self._invalidate_status()
 
-        self._notification_event.clear()
-        self._notification_data = bytearray()
+        loop = asyncio.get_running_loop()
+        timeout_handle: asyncio.TimerHandle | None = None
+        if wait_for_response:
+            # Register before writing so a fast reply is not missed
+            future: asyncio.Future[bytes] = loop.create_future()
+            self._response_future = future
+            self._expected_cmd = expected_cmd
 
         try:
-            _LOGGER.debug("Sending command: %s", command.hex())
-            await self._client.write_gatt_char(WRITE_CHAR_UUID, command, response=False)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sending command: %s", command.hex())
+            async with asyncio.timeout(WRITE_TIMEOUT):
+                await self._client.write_gatt_char(
+                    self._write_char, command, response=self._write_response
+                )
             
             if not wait_for_response:
                 return bytearray()
 
             # Wait for response with timeout
+            timeout_handle = loop.call_later(
+                timeout,
+                lambda: future.done() or future.set_exception(TimeoutError()),
+            )
             try:
-                await asyncio.wait_for(self._notification_event.wait(), timeout=timeout)
-            except asyncio.TimeoutError:
+                return await future
+            except TimeoutError:
                 _LOGGER.warning("Timeout waiting for response")
                 return bytearray()
-
-            return self._notification_data
         except Exception as err:
             _LOGGER.error("Error sending command: %s", err)
             raise
-
-    def _calculate_checksum(self, data: bytes) -> int:
-        """Calculate checksum for command."""
-        # Sum of bytes 2 to end (excluding checksum itself if present)
-        # But for our build_command, we sum bytes 2-6
-        return sum(data[2:]) & 0xFF
-
-    def _build_command(self, cmd_type: int, data1: int = 0, data2: int = 0) -> bytes:
-        """Build a command with checksum."""
-        # Structure: AA 55 0C 22 [CMD] [DATA1] [DATA2] [CS]
-        # 0C 22 is fixed password "1234"
-        cmd = bytearray([0xAA, 0x55, 0x0C, 0x22, cmd_type, data1, data2, 0x00])
-        cmd[7] = sum(cmd[2:7]) & 0xFF
-        return bytes(cmd)
-
-    def _decrypt_data(self, data: bytearray) -> bytearray:
-        """Decrypts data by XORing with 'password'."""
-        key = b"password"
-        decrypted = bytearray(data)
-        for i in range(len(decrypted)):
-            decrypted[i] ^= key[i % 8]
-        return decrypted
-
-    def _notification_handler(
-        self, sender: BleakGATTCharacteristic, data: bytearray
-    ) -> None:
-        """Handle notification data."""
-        _LOGGER.debug("Received notification: %s", data.hex())
-        
-        # Check for Encrypted Packet (starts with DA)
-        if len(data) > 0 and data[0] == 0xDA:
-            try:
-                decrypted = self._decrypt_data(data)
-                _LOGGER.debug("Decrypted Data: %s", decrypted.hex())
-                
-                if decrypted[0] == 0xAA and decrypted[1] == 0x55:
-                    self._notification_data = decrypted
-                    self._notification_event.set()
-            except Exception as err:
-                _LOGGER.error("Decryption failed: %s", err)
-
-    async def _send_command(self, command: bytes, wait_for_response: bool = True, timeout: float = 5.0) -> bytearray:
-        """Send a command and wait for response."""
+        finally:
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+            if wait_for_response:
+                self._response_future = None
+
+    async def _send_commands(self, *commands: bytes) -> None:
+        """Write several frames back-to-back without waiting for responses."""
         if not self.is_connected:
             raise BleakError("Not connected to device")
 
-        self._notification_event.clear()
-        self._notification_data = bytearray()
+        self._invalidate_status()
 
         try:
-            _LOGGER.debug("Sending command: %s", command.hex())
-            await self._client.write_gatt_char(WRITE_CHAR_UUID, command, response=False)
-            
-            if not wait_for_response:
-                return bytearray()
-
-            # Wait for response with timeout
-            try:
-                await asyncio.wait_for(self._notification_event.wait(), timeout=timeout)
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Timeout waiting for response")
-                return bytearray()
-
-            return self._notification_data
+            for command in commands:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sending command: %s", command.hex())
+                async with asyncio.timeout(WRITE_TIMEOUT):
+                    await self._client.write_gatt_char(
+                        self._write_char, command, response=self._write_response
+                    )
         except Exception as err:
-            _LOGGER.error("Error sending command: %s", err)
+            _LOGGER.error("Error sending commands: %s", err)
             raise
 
     async def get_status(self) -> dict[str, Any]:
-        """Get current status from the heater."""
+        """Get current status from the heater.
+
+        Callers within STATUS_CACHE_TTL of a read, or during one, share it.
+        """
+        if self._status_cache is not None:
+            read_at, status = self._status_cache
+            if time.monotonic() - read_at < STATUS_CACHE_TTL:
+                return dict(status)
+
+        if self._status_inflight is None:
+            self._status_inflight = asyncio.ensure_future(self._read_status())
+            self._status_inflight.add_done_callback(self._on_status_read)
+        return dict(await asyncio.shield(self._status_inflight))
+
+    def _on_status_read(self, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Cache a finished status read unless it was invalidated meanwhile."""
+        if future is not self._status_inflight:
+            return
+        self._status_inflight = None
+        if not future.cancelled() and future.exception() is None:
+            self._status_cache = (time.monotonic(), future.result())
+
+    def _invalidate_status(self) -> None:
+        """Drop the cached status so the next get_status reads the heater."""
+        self._status_cache = None
+        self._status_inflight = None
+
+    async def _read_status(self) -> dict[str, Any]:
+        """Poll the heater for a status packet and parse it."""
         try:
             # Active Polling: Send CMD_GET_STATUS
-            # We might receive other packets (like command responses), so we retry a few times
-            # until we get a status packet (Byte 2 == 0x01)
+            # Other packets (like command responses) are skipped by _send_command;
+            # retry a few times if no complete status packet (Byte 2 == 0x01) arrives
             
             max_retries = 3
             for attempt in range(max_retries):
                 # Use short timeout for polling to avoid blocking UI
-                response = await self._send_command(CMD_GET_STATUS, timeout=2.0)
+                response = await self._send_command(
+                    CMD_GET_STATUS, timeout=2.0, expected_cmd=_STATUS_CMD
+                )
                 
-                if not response or len(response) < 13:
-                    _LOGGER.warning("Invalid response received")
-                    continue
-                
-                # Check if it's a status packet (0x01)
-                if response[2] == 0x01:
+                if response and len(response) >= _STATUS_HEADER.size:
                     break
                 
-                _LOGGER.debug("Received non-status packet (cmd=%02x), retrying...", response[2])
-                await asyncio.sleep(0.1)
+                _LOGGER.warning("Invalid response received")
             else:
                 _LOGGER.warning("Failed to get valid status packet after retries")
                 raise BleakError("Failed to get valid status packet")
 
             # Parse Decrypted Data
-            _LOGGER.debug("Decrypted Status Packet: %s", response.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Decrypted Status Packet: %s", response.hex())
             
-            run_state = response[3]
-            run_mode = response[8]
+            (
+                run_state,
+                error_code,
+                run_mode,
+                byte9,
+                byte10,
+                case_temp,
+            ) = _STATUS_HEADER.unpack_from(response)
+            self._last_mode = run_mode
             
             # Logic from ESPHome (diesel_heater_ble/messages.h)
             # Mode 0: Level = Byte 10 + 1
@@ -301,17 +384,17 @@ class ParkingHeaterClient:
             target_temp = 20 # Default
             
             if run_mode == 0x00:
-                target_level = response[10] + 1
+                target_level = byte10 + 1
             elif run_mode == 0x01:
                 # User logs show Byte 10 is the level (05 = Level 5)
                 # Byte 9 was 25 (0x19), which is likely temperature or ignored
-                target_level = response[10]
+                target_level = byte10
             elif run_mode == 0x02:
-                target_temp = response[9]
-                target_level = response[10] + 1
+                target_temp = byte9
+                target_level = byte10 + 1
             else:
                 # Fallback: Try Byte 10 first as it seems more reliable for level
-                target_level = response[10] if len(response) > 10 else 1
+                target_level = byte10
             
             # Clamp level 1-10
             target_level = max(1, min(10, target_level))
@@ -331,16 +414,12 @@ class ParkingHeaterClient:
                 elif target_level != 1:
                      self._last_set_level = target_level
             
-            case_temp = response[14] + (response[13] << 8)
-            if case_temp > 32767: case_temp -= 65536
-            
             chamber_temp = 0
             if len(response) >= 34:
-                chamber_temp = response[33] + (response[32] << 8)
-                if chamber_temp > 32767: chamber_temp -= 65536
-                chamber_temp = chamber_temp / 10.0 # Often scaled by 10
+                # Often scaled by 10
+                chamber_temp = _INT16_BE.unpack_from(response, 32)[0] / 10.0
 
-            is_on = run_state in [1, 2, 3, 4] 
+            is_on = run_state in _ON_STATES
             
             status = {
                 "is_on": is_on,
@@ -350,7 +429,7 @@ class ParkingHeaterClient:
                 "current_temperature": chamber_temp, # Swapped: Bytes 32-33 (Room)
                 "chamber_temperature": case_temp,    # Swapped: Bytes 13-14 (Chamber)
                 "fan_speed": 1, # Placeholder
-                "error_code": response[4],
+                "error_code": error_code,
                 "connection_status": "Connected",
             }
             
@@ -362,47 +441,28 @@ class ParkingHeaterClient:
 
     def _get_default_status(self) -> dict[str, Any]:
         """Return default status when device is unreachable."""
-        return {
-            "is_on": False,
-            "target_temperature": MIN_TEMP,
-            "target_level": 1,
-            "current_temperature": MIN_TEMP,
-            "chamber_temperature": MIN_TEMP,
-            "fan_speed": 1,
-            "error_code": 0,
-            "connection_status": "Unknown",
-        }
+        return dict(_DEFAULT_STATUS)
 
     async def set_power(self, power_on: bool) -> None:
         """Turn the heater on or off."""
         # Turn On: 03 01 00
         # Turn Off: 03 00 00
-        command = self._build_command(0x03, 0x01 if power_on else 0x00)
-        
-        # We wait for response to ensure the command is processed
-        # Retry logic for robustness
-        for attempt in range(3):
-            try:
-                # Use reasonable timeout for commands
-                await self._send_command(command, wait_for_response=True, timeout=3.0)
-                await asyncio.sleep(0.5) 
-                _LOGGER.info("Set power to %s (Attempt %d)", "ON" if power_on else "OFF", attempt + 1)
-                return
-            except Exception as e:
-                _LOGGER.warning("Set power failed (Attempt %d): %s", attempt + 1, e)
-                await asyncio.sleep(0.5)
-        
-        _LOGGER.warning("Failed to set power after 3 attempts, sending blindly")
-        try:
-            await self._send_command(command, wait_for_response=False)
-        except:
-            pass
+        command = CMD_TURN_ON if power_on else CMD_TURN_OFF
+
+        # Don't wait for the echo; the next status poll confirms the new state.
+        # Write errors propagate so the coordinator can keep the command queued
+        await self._send_command(command, wait_for_response=False)
+        _LOGGER.info("Set power to %s", "ON" if power_on else "OFF")
 
     async def set_mode(self, mode: int) -> None:
         """Set running mode (1=Manual/Level, 2=Auto/Temp)."""
+        if mode not in CMD_SET_MODE_FRAMES:
+            raise ValueError(f"Mode must be {MODE_MANUAL} or {MODE_AUTO}")
+
         # Command: 02 [Mode] 00
-        command = self._build_command(0x02, mode)
+        command = CMD_SET_MODE_FRAMES[mode]
         await self._send_command(command, wait_for_response=False)
+        self._last_mode = mode
         _LOGGER.info("Set mode to %d", mode)
 
     async def set_temperature(self, temperature: int) -> None:
@@ -410,13 +470,14 @@ class ParkingHeaterClient:
         if not MIN_TEMP <= temperature <= MAX_TEMP:
             raise ValueError(f"Temperature must be between {MIN_TEMP} and {MAX_TEMP}")
 
-        # Ensure Auto Mode (2) first
-        await self.set_mode(2)
-        await asyncio.sleep(0.2)
-        
+        # Ensure Auto Mode (2) first; the mode frame is not acknowledged,
+        # so give the heater time to apply it before sending the temperature
+        if self._last_mode != MODE_AUTO:
+            await self.set_mode(MODE_AUTO)
+            await asyncio.sleep(MODE_SETTLE_DELAY)
+
         # Command: 04 [Temp] 00
-        command = self._build_command(0x04, temperature)
-        await self._send_command(command, wait_for_response=False)
+        await self._send_commands(CMD_SET_VALUE_FRAMES[temperature])
         _LOGGER.info("Set temperature to %d°C", temperature)
 
     async def set_level(self, level: int) -> None:
@@ -424,26 +485,32 @@ class ParkingHeaterClient:
         if not 1 <= level <= 10:
             raise ValueError("Level must be between 1 and 10")
 
-        # Ensure Manual Mode (1) first
-        await self.set_mode(1)
-        await asyncio.sleep(0.5) # Wait for mode switch
+        # Ensure Manual Mode (1) first; the mode frame is not acknowledged,
+        # so give the heater time to apply it before sending the level
+        if self._last_mode != MODE_MANUAL:
+            await self.set_mode(MODE_MANUAL)
+            await asyncio.sleep(MODE_SETTLE_DELAY)
 
         # Command: 04 [Level] 00
-        command = self._build_command(0x04, level)
+        command = CMD_SET_VALUE_FRAMES[level]
         
-        # Retry logic
+        # Retry logic; a failed write or a missing reply is retried after a
+        # short backoff, and the last failure is raised to the caller
         for attempt in range(3):
             try:
-                await self._send_command(command, wait_for_response=True)
-                await asyncio.sleep(0.5)
+                response = await self._send_command(command, wait_for_response=True)
+                if not response:
+                    # _send_command swallows the response timeout
+                    raise TimeoutError("No response to set level")
                 _LOGGER.info("Set level to %d (Attempt %d)", level, attempt + 1)
                 self._last_set_level = level # Update local state
                 return
-            except Exception as e:
+            except (BleakError, TimeoutError) as e:
                 _LOGGER.warning("Set level failed (Attempt %d): %s", attempt + 1, e)
+                if attempt == 2:
+                    # Let the caller know the heater never accepted the level
+                    raise
                 await asyncio.sleep(1.0)
-                
-        _LOGGER.error("Failed to set level after 3 attempts")
 
     async def set_fan_speed(self, fan_speed: int) -> None:
         """Set fan speed (1-5)."""
@@ -7,54 +7,103 @@ from __future__ import annotations
 
 from typing import Dict, Any
 import asyncio
+import contextlib
 import logging
 
 from bleak import BleakScanner
 
+from homeassistant.components.bluetooth import async_discovered_service_info
+from homeassistant.core import HomeAssistant
+
 _LOGGER = logging.getLogger(__name__)
 
+# An untargeted scan ends early once this many new devices have been seen
+# and no further new device has appeared for SCAN_SETTLE_TIME seconds
+SCAN_SETTLE_MIN_DEVICES = 5
+SCAN_SETTLE_TIME = 2.0
+
+
+def _async_cached_devices(hass: HomeAssistant) -> Dict[str, Dict[str, Any]]:
+    """Return devices Home Assistant's own scanners have already seen."""
+    return {
+        info.address: {
+            "name": info.name or info.address,
+            "rssi": info.rssi,
+            "uuids": info.service_uuids,
+            "address": info.address,
+        }
+        for info in async_discovered_service_info(hass)
+    }
+
 
-async def async_ble_scan(timeout: float = 8.0) -> Dict[str, Dict[str, Any]]:
+async def async_ble_scan(
+    timeout: float = 8.0,
+    target_address: str | None = None,
+    hass: HomeAssistant | None = None,
+) -> Dict[str, Dict[str, Any]]:
     """Perform a BLE scan and return discovered devices.
 
     Returns a dict keyed by address with fields: name, rssi, uuids, metadata.
+    If target_address is given, the scan ends as soon as that device is seen.
+    If hass is given, devices Home Assistant already knows are included, and
+    no scan is started at all when the target is among them.
     """
+    devices: Dict[str, Dict[str, Any]] = {}
+    found = asyncio.Event()
+    target = target_address.upper() if target_address else None
+
+    if hass is not None:
+        devices = _async_cached_devices(hass)
+        if target and any(address.upper() == target for address in devices):
+            _LOGGER.debug("Target %s already known, skipping BLE scan", target)
+            return devices
+
     _LOGGER.debug("Starting BLE scan for %ss", timeout)
-    devices = {}
-    discovered = []
+    loop = asyncio.get_running_loop()
+    new_devices = 0
+    last_new = loop.time()
 
     def detection_callback(device, advertisement_data):
-        """Handle device discovery."""
-        discovered.append((device, advertisement_data))
+        """Handle device discovery, keeping the latest advertisement per address."""
+        nonlocal new_devices, last_new
+        if device.address not in devices:
+            new_devices += 1
+            last_new = loop.time()
+        # bleak already reports service UUIDs as lower-case strings
+        uuids = getattr(advertisement_data, "service_uuids", None) or []
+        devices[device.address] = {
+            "name": device.name or device.address,
+            "rssi": advertisement_data.rssi,
+            "uuids": uuids,
+            "address": device.address,
+        }
+        if target and device.address.upper() == target:
+            found.set()
 
     scanner = BleakScanner(detection_callback=detection_callback)
     try:
         await scanner.start()
-        await asyncio.sleep(timeout)
-        await scanner.stop()
+        if target:
+            await asyncio.wait_for(found.wait(), timeout)
+        else:
+            deadline = loop.time() + timeout
+            while (now := loop.time()) < deadline:
+                if (
+                    new_devices >= SCAN_SETTLE_MIN_DEVICES
+                    and now - last_new >= SCAN_SETTLE_TIME
+                ):
+                    break
+                await asyncio.sleep(min(0.25, deadline - now))
+    except TimeoutError:
+        pass
     except Exception as exc:
-        _LOGGER.exception("BLE scan failed: %s", exc)
-        try:
+        # Usually a busy or missing adapter, not a bug worth a traceback;
+        # keep whatever was seen before the failure
+        _LOGGER.warning("BLE scan failed: %s", exc)
+        return devices
+    finally:
+        with contextlib.suppress(Exception):
             await scanner.stop()
-        except Exception:
-            pass
-        return {}
-
-    for d, ad in discovered:
-        # bleak BLEDevice
-        try:
-            uuids = []
-            if hasattr(ad, 'service_uuids'):
-                uuids = ad.service_uuids or []
-        except Exception:
-            uuids = []
-
-        devices[d.address] = {
-            "name": d.name or d.address,
-            "rssi": ad.rssi,
-            "uuids": [u.lower() for u in uuids],
-            "address": d.address,
-        }
 
     _LOGGER.debug("BLE scan found %d devices", len(devices))
     return devices
@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -41,30 +40,28 @@ class ParkingHeaterLevelNumber(CoordinatorEntity[ParkingHeaterCoordinator], Numb
         self._attr_icon = "mdi:speedometer"
         self._attr_native_min_value = MIN_LEVEL
         self._attr_native_max_value = MAX_LEVEL
-        self._attr_native_max_value = MAX_LEVEL
         self._attr_native_step = LEVEL_STEP
+        self._attr_device_info = coordinator.device_info
+        self._update_attrs()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # CoordinatorEntity overrides available, so point it back at the cache
+        return self._attr_available
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        if self.coordinator.data:
-            val = self.coordinator.data.get("target_level", 1)
-            # _LOGGER.debug("ParkingHeaterLevelNumber: native_value = %s (data keys: %s)", val, self.coordinator.data.keys())
-            return val
-        return None 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Cache availability and the current level from coordinator data."""
+        data = self.coordinator.data
+        self._attr_available = data is not None
+        self._attr_native_value = data.get("target_level", 1) if data else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
-        await self.coordinator.client.set_level(int(value))
-        # We should probably trigger a refresh
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
+        await self.coordinator.async_set_level(int(value))
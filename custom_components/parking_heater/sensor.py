@@ -11,7 +11,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -20,6 +20,9 @@ from .coordinator import ParkingHeaterCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Run state text, indexed by the state code the heater reports
+RUN_STATES = ("Off", "On", "Ignition", "Heating", "Shutdown/Cooling", "Standby")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,7 +43,40 @@ async def async_setup_entry(
     async_add_entities(sensors)
 
 
-class ParkingHeaterConnectionStatusSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+    """Base for sensors that cache their value when the coordinator updates."""
+
+    _data_key: str
+
+    def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._update_attrs()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # CoordinatorEntity overrides available, so point it back at the cache
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Cache availability and value from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_available = data is not None
+        self._attr_native_value = self._value_from(data) if data else None
+
+    def _value_from(self, data: dict[str, Any]) -> Any:
+        """Return the sensor value from non-empty coordinator data."""
+        return data.get(self._data_key)
+
+
+class ParkingHeaterConnectionStatusSensor(ParkingHeaterSensor):
     """Represents the connection status of the heater."""
 
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
@@ -49,54 +85,32 @@ class ParkingHeaterConnectionStatusSensor(CoordinatorEntity[ParkingHeaterCoordin
         self._attr_name = f"{coordinator.entry.title} Connection Status"
         self._attr_unique_id = f"{coordinator.mac_address}_connection_status"
         self._attr_icon = "mdi:bluetooth-connect"
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("connection_status", "Unknown")
-        return "Unknown"
-    
-    @property
-    def available(self) -> bool:
-        """Always available to show status."""
-        return True
+    def _update_attrs(self) -> None:
+        """Cache the connection status; always available to show it."""
+        data = self.coordinator.data
+        self._attr_available = True
+        self._attr_native_value = (
+            data.get("connection_status", "Unknown") if data else "Unknown"
+        )
 
 
-class ParkingHeaterErrorSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterErrorSensor(ParkingHeaterSensor):
     """Represents the error code sensor for the Parking Heater."""
 
+    _data_key = "error_code"
+
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_name = f"{coordinator.entry.title} Error Code"
         self._attr_unique_id = f"{coordinator.mac_address}_error_code"
         self._attr_icon = "mdi:alert-circle-outline"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("error_code")
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
+        self._attr_device_info = coordinator.device_info
 
 
-class ParkingHeaterRunStateSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterRunStateSensor(ParkingHeaterSensor):
     """Represents the run state of the heater."""
 
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
@@ -105,38 +119,21 @@ class ParkingHeaterRunStateSensor(CoordinatorEntity[ParkingHeaterCoordinator], S
         self._attr_name = f"{coordinator.entry.title} State"
         self._attr_unique_id = f"{coordinator.mac_address}_run_state"
         self._attr_icon = "mdi:fire-alert"
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
+    def _value_from(self, data: dict[str, Any]) -> str:
+        """Map the run state code to text."""
+        state_code = data.get("run_state")
+        if isinstance(state_code, int) and 0 <= state_code < len(RUN_STATES):
+            return RUN_STATES[state_code]
+        return f"Unknown ({state_code})"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            state_code = self.coordinator.data.get("run_state")
-            # Map state code to text
-            # 0=Off, 1=On, 2=Ignition, 3=Heating, 4=Shutdown, 5=Standby
-            return {
-                0: "Off",
-                1: "On",
-                2: "Ignition",
-                3: "Heating",
-                4: "Shutdown/Cooling",
-                5: "Standby"
-            }.get(state_code, f"Unknown ({state_code})")
-        return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
-
-
-class ParkingHeaterChamberTempSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterChamberTempSensor(ParkingHeaterSensor):
     """Represents the chamber temperature sensor."""
 
+    _data_key = "chamber_temperature"
+
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -146,28 +143,14 @@ class ParkingHeaterChamberTempSensor(CoordinatorEntity[ParkingHeaterCoordinator]
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("chamber_temperature")
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
+        self._attr_device_info = coordinator.device_info
 
 
-class ParkingHeaterCaseTempSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterCaseTempSensor(ParkingHeaterSensor):
     """Represents the case (room) temperature sensor."""
 
+    _data_key = "current_temperature"
+
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -176,28 +159,14 @@ class ParkingHeaterCaseTempSensor(CoordinatorEntity[ParkingHeaterCoordinator], S
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("current_temperature")
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
-
-
-class ParkingHeaterFanLevelSensor(CoordinatorEntity[ParkingHeaterCoordinator], SensorEntity):
+class ParkingHeaterFanLevelSensor(ParkingHeaterSensor):
     """Represents the fan level sensor (for debugging)."""
 
+    _data_key = "target_level"
+
     def __init__(self, coordinator: ParkingHeaterCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -205,20 +174,5 @@ class ParkingHeaterFanLevelSensor(CoordinatorEntity[ParkingHeaterCoordinator], S
         self._attr_unique_id = f"{coordinator.mac_address}_fan_level"
         self._attr_icon = "mdi:fan"
         self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return self.coordinator.device_info
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("target_level")
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None
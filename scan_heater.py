@@ -16,6 +16,7 @@ _LOGGER = logging.getLogger(__name__)
 
 HEATER_MAC = "E0:4E:7A:AD:E8:EE"
 BLUETOOTH_ADAPTER = "hci1"
+DEFAULT_ADAPTER = "hci0"  # What BlueZ uses when no adapter is given
 
 
 async def scan_bluetooth():
@@ -41,13 +42,14 @@ async def scan_bluetooth():
         _LOGGER.info("")
         
         heater_found = False
+        target_mac = HEATER_MAC.upper()
         
         for address, (device, adv_data) in devices.items():
             name = device.name or "Unknown"
-            rssi = adv_data.rssi if hasattr(adv_data, 'rssi') else "N/A"
+            rssi = getattr(adv_data, 'rssi', "N/A")
             
             # Check if this is our heater
-            is_our_heater = address.upper() == HEATER_MAC.upper()
+            is_our_heater = address.upper() == target_mac
             
             if is_our_heater:
                 _LOGGER.info("="*60)
@@ -55,17 +57,23 @@ async def scan_bluetooth():
                 _LOGGER.info("="*60)
                 heater_found = True
             
-            _LOGGER.info(f"{'🎯' if is_our_heater else '📱'} Device: {name}")
-            _LOGGER.info(f"   Address: {address}")
-            _LOGGER.info(f"   RSSI: {rssi} dBm")
+            # One record per device instead of one per line
+            lines = [
+                f"{'🎯' if is_our_heater else '📱'} Device: {name}",
+                f"   Address: {address}",
+                f"   RSSI: {rssi} dBm",
+            ]
             
-            if hasattr(adv_data, 'service_uuids') and adv_data.service_uuids:
-                _LOGGER.info(f"   Services: {adv_data.service_uuids}")
+            service_uuids = getattr(adv_data, 'service_uuids', None)
+            if service_uuids:
+                lines.append(f"   Services: {service_uuids}")
             
-            if hasattr(adv_data, 'manufacturer_data') and adv_data.manufacturer_data:
-                _LOGGER.info(f"   Manufacturer: {adv_data.manufacturer_data}")
+            manufacturer_data = getattr(adv_data, 'manufacturer_data', None)
+            if manufacturer_data:
+                lines.append(f"   Manufacturer: {manufacturer_data}")
             
-            _LOGGER.info("")
+            lines.append("")
+            _LOGGER.info("\n".join(lines))
             
             if is_our_heater:
                 _LOGGER.info("="*60)
@@ -98,20 +106,33 @@ async def check_adapter():
     """Check if the Bluetooth adapter is available."""
     _LOGGER.info("🔧 Checking Bluetooth adapter...")
     
-    try:
-        # Try scanning with default adapter
-        devices_default = await BleakScanner.discover(timeout=2.0)
+    if BLUETOOTH_ADAPTER in (None, DEFAULT_ADAPTER):
+        # Only one radio to probe; a second scan on it at the same time
+        # would be rejected by BlueZ (InProgress) and look like a fault
+        probes = (BleakScanner.discover(timeout=2.0),)
+    else:
+        # Two different adapters are independent radios, so probe both at once
+        probes = (
+            BleakScanner.discover(timeout=2.0),
+            BleakScanner.discover(adapter=BLUETOOTH_ADAPTER, timeout=2.0),
+        )
+    devices_default, *rest = await asyncio.gather(*probes, return_exceptions=True)
+
+    if isinstance(devices_default, Exception):
+        _LOGGER.error(f"❌ Default adapter issue: {devices_default}")
+    else:
         _LOGGER.info(f"✅ Default adapter works ({len(devices_default)} devices)")
-    except Exception as e:
-        _LOGGER.error(f"❌ Default adapter issue: {e}")
-    
-    try:
-        # Try scanning with hci1
-        devices_hci1 = await BleakScanner.discover(adapter=BLUETOOTH_ADAPTER, timeout=2.0)
-        _LOGGER.info(f"✅ {BLUETOOTH_ADAPTER} works ({len(devices_hci1)} devices)")
-    except Exception as e:
-        _LOGGER.error(f"❌ {BLUETOOTH_ADAPTER} issue: {e}")
+
+    if not rest:
+        _LOGGER.info("")
+        return
+
+    devices_hci1 = rest[0]
+    if isinstance(devices_hci1, Exception):
+        _LOGGER.error(f"❌ {BLUETOOTH_ADAPTER} issue: {devices_hci1}")
         _LOGGER.info("💡 Try using default adapter (remove adapter parameter)")
+    else:
+        _LOGGER.info(f"✅ {BLUETOOTH_ADAPTER} works ({len(devices_hci1)} devices)")
     
     _LOGGER.info("")
 
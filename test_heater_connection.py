@@ -13,6 +13,10 @@ from bleak import BleakClient, BleakError, BleakScanner
 HEATER_MAC = "E0:4E:7A:AD:EA:5D"
 BLUETOOTH_ADAPTER = "hci0"
 PASSWORD = "1234"
+# Reuse the GATT table BlueZ cached on an earlier run instead of waiting for
+# service discovery again. Off by default: a stale cache (after a firmware
+# update or on another adapter) gives wrong characteristic handles.
+USE_BLUEZ_GATT_CACHE = False
 
 # --- UUIDs ---
 # --- UUIDs ---
@@ -70,10 +74,23 @@ def build_command(command: int, data: int, mode: int = 0x55, passkey: str = "123
     
     return payload
 
+# --- Fixed Frames ---
+# Structure: AA 55 0C 22 [CMD] [D1] [D2] [CS], 0C 22 = "1234" (Fixed Password)
+CMD_TURN_ON = bytes(build_command(3, 1))     # 03 01 00
+CMD_TURN_OFF = bytes(build_command(3, 0))    # 03 00 00
+CMD_GET_STATUS = bytes(build_command(1, 0))  # 01 00 00 -> AA 55 0C 22 01 00 00 2F
+
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 _LOGGER = logging.getLogger(__name__)
 
+# Passkeys tried by authenticate()
+# Added "0132" and "0120" based on received status packet "AA 55 01 20..."
+AUTH_PASSWORDS = ("1234", "0000", "1111", "8888", "9999", "1688", "54321", "6666", "123456", "654321", "0132", "0120")
+
+# Handshake frames (Command 1, Mode 85) for each passkey, built once
+HANDSHAKE_FRAMES = {pk: bytes(build_command(1, 0, mode=0x55, passkey=pk)) for pk in AUTH_PASSWORDS}
+
 
 class HeaterCommander:
     def __init__(self, address: str, adapter: str):
@@ -81,7 +98,10 @@ class HeaterCommander:
         self.adapter = adapter
         self.client = None
         self.is_authenticated = False
-        self.notification_queue = asyncio.Queue()
+        # Bounded so notifications nobody waits for (e.g. while monitoring)
+        # cannot pile up; the oldest is dropped when full
+        self.notification_queue = asyncio.Queue(maxsize=16)
+        self.notifying = set()  # UUIDs subscribed on the current connection
         
         # Protocol State
         self.use_old_protocol = False
@@ -246,12 +266,28 @@ class HeaterCommander:
             _LOGGER.info(f"  Byte 10 (Val2?): {data[10] if len(data) > 10 else 'N/A'}")
             _LOGGER.info(f"---------------------\n")
 
+    async def ensure_notify(self, uuid: str):
+        """Subscribe to notifications on uuid once per connection."""
+        if uuid in self.notifying:
+            return
+        await self.client.start_notify(uuid, self.notification_handler)
+        self.notifying.add(uuid)
+        _LOGGER.info(f"✅ Listening on {uuid}")
+
     def notification_handler(self, sender, data):
         """Handle BLE notifications and put them in a queue."""
-        _LOGGER.info(f"[RECV] Notification from {sender}: {data.hex()}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("[RECV] Notification from %s: %s", sender, data.hex())
         self.parse_notification(data)
+        if self.notification_queue.full():
+            self.notification_queue.get_nowait()
         self.notification_queue.put_nowait(data)
 
+    def clear_notifications(self):
+        """Drop queued notifications so the next get() is a reply to the next write."""
+        while not self.notification_queue.empty():
+            self.notification_queue.get_nowait()
+
     async def turn_on(self):
         """Sends the Turn On command (0x03, 0x01)."""
         if not self.client or not self.client.is_connected:
@@ -259,12 +295,7 @@ class HeaterCommander:
             return
 
         _LOGGER.info("Sending Turn ON command...")
-        # Structure: AA 55 0C 22 03 01 00 [CS]
-        # 0C 22 = "1234" (Fixed Password)
-        # 03 = Power Command
-        # 01 = ON
-        cmd = bytearray([0xAA, 0x55, 0x0C, 0x22, 0x03, 0x01, 0x00, 0x00])
-        cmd[7] = sum(cmd[2:7]) & 0xFF
+        cmd = CMD_TURN_ON
         
         await self.client.write_gatt_char(self.write_uuid, cmd)
         _LOGGER.info(f"Sent: {cmd.hex()}")
@@ -276,11 +307,7 @@ class HeaterCommander:
             return
 
         _LOGGER.info("Sending Turn OFF command...")
-        # Structure: AA 55 0C 22 03 00 00 [CS]
-        # 03 = Power Command
-        # 00 = OFF
-        cmd = bytearray([0xAA, 0x55, 0x0C, 0x22, 0x03, 0x00, 0x00, 0x00])
-        cmd[7] = sum(cmd[2:7]) & 0xFF
+        cmd = CMD_TURN_OFF
         
         await self.client.write_gatt_char(self.write_uuid, cmd)
         _LOGGER.info(f"Sent: {cmd.hex()}")
@@ -310,13 +337,16 @@ class HeaterCommander:
             return
         _LOGGER.info(f"Connecting to {self.address}...")
         try:
-            self.client = BleakClient(self.address, adapter=BLUETOOTH_ADAPTER, timeout=20.0)
-            await self.client.connect()
+            # Build the client once and reconnect it, rather than setting up a
+            # new backend (and its D-Bus subscriptions) for every connect
+            if self.client is None:
+                self.client = BleakClient(self.address, adapter=self.adapter, timeout=20.0)
+            await self.client.connect(dangerous_use_bleak_cache=USE_BLUEZ_GATT_CACHE)
             _LOGGER.info("Connected successfully!")
             self.is_authenticated = False
+            self.notifying.clear()
         except Exception as e:
             _LOGGER.error(f"Connection failed: {e}")
-            self.client = None
 
     async def disconnect(self):
         """Disconnect from the heater."""
@@ -325,8 +355,8 @@ class HeaterCommander:
             return
         await self.client.disconnect()
         _LOGGER.info("Disconnected.")
-        self.client = None
         self.is_authenticated = False
+        self.notifying.clear()
 
     async def handshake(self, passkey: str) -> bool:
         """
@@ -335,34 +365,37 @@ class HeaterCommander:
         """
         _LOGGER.info(f"Performing handshake with passkey '{passkey}'...")
         
-        # Clear queue
-        while not self.notification_queue.empty():
-            self.notification_queue.get_nowait()
+        self.clear_notifications()
 
         # Step 1: Send Command 1, Mode 85 (AA 55 ...) with passkey
-        cmd1 = build_command(1, 0, mode=0x55, passkey=passkey)
+        cmd1 = HANDSHAKE_FRAMES.get(passkey) or build_command(1, 0, mode=0x55, passkey=passkey)
         _LOGGER.info(f"Handshake Step 1: {cmd1.hex()}")
-        await self.client.write_gatt_char(self.write_uuid, cmd1)
+        # The notification below is the confirmation, so skip the ATT ack
+        await self.client.write_gatt_char(self.write_uuid, cmd1, response=False)
         
         # Wait for response - STRICT CHECK
+        # Skip unrelated notifications until an AA 55 reply or the 3s deadline
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 3.0
         try:
-            response = await asyncio.wait_for(self.notification_queue.get(), timeout=3.0)
-            
-            # Check for success response (AA 55) OR Encrypted (DA)
-            if len(response) >= 2:
-                if response[0] == 0xAA and response[1] == 0x55:
-                    _LOGGER.info("Handshake Step 1 accepted (Status AA 55 received).")
-                    return True
-                elif response[0] == 0xDA:
-                    _LOGGER.info("Handshake Step 1 accepted (Encrypted DA received).")
-                    # Verify decryption
-                    decrypted = self.decrypt_data(response)
-                    if decrypted[0] == 0xAA and decrypted[1] == 0x55:
-                        _LOGGER.info("Decrypted successfully to AA 55.")
+            while True:
+                response = await asyncio.wait_for(
+                    self.notification_queue.get(), timeout=max(0.0, deadline - loop.time())
+                )
+                
+                # Check for success response (AA 55) OR Encrypted (DA)
+                if len(response) >= 2:
+                    if response[0] == 0xAA and response[1] == 0x55:
+                        _LOGGER.info("Handshake Step 1 accepted (Status AA 55 received).")
                         return True
-            
-            _LOGGER.warning(f"Unexpected response: {response.hex()}. Treating as failure.")
-            return False
+                    elif response[0] == 0xDA:
+                        # Verify decryption
+                        decrypted = self.decrypt_data(response)
+                        if decrypted[0] == 0xAA and decrypted[1] == 0x55:
+                            _LOGGER.info("Handshake Step 1 accepted (Encrypted DA decrypted to AA 55).")
+                            return True
+                
+                _LOGGER.warning(f"Unexpected response: {response.hex()}. Still waiting...")
 
         except asyncio.TimeoutError:
             # No response means failure in strict mode
@@ -393,16 +426,12 @@ class HeaterCommander:
             for uuid in notify_uuids:
                 _LOGGER.info(f"Starting notifications on {uuid}...")
                 try:
-                    await self.client.start_notify(uuid, self.notification_handler)
-                    _LOGGER.info(f"✅ Listening on {uuid}")
+                    await self.ensure_notify(uuid)
                 except Exception as e:
                     _LOGGER.warning(f"Could not start notify on {uuid}: {e}")
 
             # Try common passwords
-            # Added "0132" and "0120" based on received status packet "AA 55 01 20..."
-            passwords = ["1234", "0000", "1111", "8888", "9999", "1688", "54321", "6666", "123456", "654321", "0132", "0120"]
-            
-            for pk in passwords:
+            for pk in AUTH_PASSWORDS:
                 if await self.handshake(pk):
                     _LOGGER.info(f"✅ Authentication Successful with passkey '{pk}'!")
                     self.is_authenticated = True
@@ -410,7 +439,8 @@ class HeaterCommander:
                     PASSWORD = pk
                     return
                 _LOGGER.warning(f"Authentication failed with passkey '{pk}'. Retrying...")
-                await asyncio.sleep(1.0)
+                # handshake() already waited for a reply; just let the link settle
+                await asyncio.sleep(0.1)
 
             _LOGGER.error("❌ All passwords failed.")
             self.is_authenticated = False
@@ -438,10 +468,9 @@ class HeaterCommander:
         
         # Ensure notifications are enabled
         try:
-            await self.client.start_notify(self.notify_uuid, self.notification_handler)
-            _LOGGER.info(f"✅ Listening on {self.notify_uuid}")
+            await self.ensure_notify(self.notify_uuid)
         except Exception as e:
-            _LOGGER.warning(f"Could not start notify (might be already started): {e}")
+            _LOGGER.warning(f"Could not start notify: {e}")
 
         start_time = time.time()
         
@@ -503,7 +532,7 @@ class HeaterCommander:
                 try:
                     await self.connect()
                     await asyncio.sleep(2.0)
-                    await self.client.start_notify(self.notify_uuid, self.notification_handler)
+                    await self.ensure_notify(self.notify_uuid)
                     i -= 1 
                     continue
                 except Exception as reconnect_error:
@@ -528,11 +557,10 @@ class HeaterCommander:
         _LOGGER.info(f"  Payload: {command.hex()}")
         
         try:
-            # Clear queue before sending
-            while not self.notification_queue.empty():
-                self.notification_queue.get_nowait()
+            self.clear_notifications()
                 
-            await self.client.write_gatt_char(self.write_uuid, command)
+            # Only ask for an ATT ack when no notification will confirm the write
+            await self.client.write_gatt_char(self.write_uuid, command, response=not expect_response)
             
             if expect_response:
                 _LOGGER.info("  Command sent. Waiting 5s for a notification...")
@@ -552,12 +580,30 @@ class HeaterCommander:
 
     async def scan_devices(self):
         """Scan for available Bluetooth devices."""
-        print(f"\nScanning for devices on {self.adapter} (5s)...")
+        print(f"\nScanning for devices on {self.adapter} (up to 5s, stops once {self.address} is seen)...")
+        seen = set()
+        target = self.address.upper()
+        found = asyncio.Event()
+
+        def detection_callback(device, adv_data):
+            # Print each device as it first appears instead of after the scan
+            if device.address in seen:
+                return
+            seen.add(device.address)
+            print(f"  {device.address} - {device.name} ({adv_data.rssi} dBm)")
+            if device.address.upper() == target:
+                found.set()
+
+        scanner = BleakScanner(detection_callback=detection_callback, adapter=self.adapter)
         try:
-            devices = await BleakScanner.discover(adapter=self.adapter, timeout=5.0)
-            print(f"Found {len(devices)} devices:")
-            for d in devices:
-                print(f"  {d.address} - {d.name} ({d.rssi} dBm)")
+            await scanner.start()
+            try:
+                await asyncio.wait_for(found.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await scanner.stop()
+            print(f"Found {len(seen)} devices.")
         except Exception as e:
             _LOGGER.error(f"Scan failed: {e}")
 
@@ -666,13 +712,11 @@ class HeaterCommander:
         
         # Ensure notifications are enabled
         try:
-            await self.client.start_notify(self.notify_uuid, self.notification_handler)
-            _LOGGER.info(f"✅ Listening on {self.notify_uuid}")
+            await self.ensure_notify(self.notify_uuid)
         except Exception as e:
             pass
             
-        # Command: AA 55 0C 22 01 00 00 2F (Get Status, with "1234" ID)
-        cmd = bytearray([0xAA, 0x55, 0x0C, 0x22, 0x01, 0x00, 0x00, 0x2F])
+        cmd = CMD_GET_STATUS
         
         try:
             while True:
@@ -705,10 +749,8 @@ class HeaterCommander:
 
         # Ensure notifications are enabled
         try:
-            await self.client.start_notify(self.notify_uuid, self.notification_handler)
-            _LOGGER.info(f"✅ Listening on {self.notify_uuid}")
+            await self.ensure_notify(self.notify_uuid)
         except Exception as e:
-            # Ignore if already notifying
             pass
 
         raw_input = await asyncio.get_event_loop().run_in_executor(None, input, "Enter raw hex command (e.g., AA 55 0C 22 01 00 00 2F): ")
@@ -717,6 +759,7 @@ class HeaterCommander:
             cmd_bytes = bytearray.fromhex(raw_input.replace(" ", ""))
             _LOGGER.info(f"Sending Raw Command: {cmd_bytes.hex()}")
             
+            self.clear_notifications()
             await self.client.write_gatt_char(self.write_uuid, cmd_bytes)
             _LOGGER.info("Command sent.")
             